@@ -1,103 +1,203 @@
 import asyncio
+import collections
+import logging
+import threading
+import time
 import tkinter as tk
 from bleak import BleakScanner, BleakClient
+from bleak.exc import BleakError
 import os
 from dotenv import load_dotenv
 
+# uvloop's C-implemented loop schedules tasks 2-4x faster; optional.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
 SERVICE_UUID = os.getenv("SERVICE_UUID")
 CHARACTERISTIC_UUID = os.getenv("CHARACTERISTIC_UUID")
 
-keys_pressed = set()
+keys_mask = 0
 last_command = None
+last_enqueued = None
 reversed_on = False
 current_speed = 50
 ble_client = None
+ble_char = None
+ble_write_response = True
+ble_loop = None
 root = None
 label = None
 command_sender_task = None
-command_queue = asyncio.Queue()
+# Command pipe: a deque drained in bursts by the processor, which keeps only
+# the newest movement and the newest speed command per burst - movements are
+# latest-wins, but a speed change must never be clobbered by one. The maxlen
+# drops the oldest entries if the BLE link stalls, bounding memory for good.
+pending_commands = collections.deque(maxlen=16)
+command_pending = asyncio.Event()
+speed_dirty = asyncio.Event()
+last_send_ts = 0.0  # monotonic time of the last GATT write (watchdog input)
+
+# Bit per key: mask = (w<<3) | (s<<2) | (a<<1) | d
+KEY_BITS = {'w': 0b1000, 's': 0b0100, 'a': 0b0010, 'd': 0b0001}
+
+def _build_cmd_table(reversed_on):
+    table = {}
+    for mask in range(16):
+        if mask & KEY_BITS['w'] and mask & KEY_BITS['s']:
+            cmd = "%S" if reversed_on else "%W"
+        elif mask & KEY_BITS['w']:
+            cmd = "%W"
+        elif mask & KEY_BITS['s']:
+            cmd = "%S"
+        elif mask & KEY_BITS['a']:
+            cmd = "%L"
+        elif mask & KEY_BITS['d']:
+            cmd = "%R"
+        else:
+            cmd = "%"
+        table[mask] = cmd.encode()
+    return table
+
+# Precomputed at import so the hot path is a single dict index, no encode().
+CMD_TABLE = _build_cmd_table(False)
+CMD_TABLE_REV = _build_cmd_table(True)
+SPEED_CMDS = [f"%{i}-".encode() for i in range(101)]
+
+def _keys_text(mask):
+    pressed = sorted(key for key, bit in KEY_BITS.items() if mask & bit)
+    return "Keys currently pressed:\n" + (", ".join(pressed).upper() if pressed else "None")
+
+# 16 possible key states -> display text, built once instead of re-sorting
+# and re-joining on every redraw.
+KEYS_TEXT = {mask: _keys_text(mask) for mask in range(16)}
 
 def get_command():
-    if 'w' in keys_pressed and 's' in keys_pressed:
-        return "%S" if reversed_on else "%W"
-    elif 'w' in keys_pressed:
-        return "%W"
-    elif 's' in keys_pressed:
-        return "%S"
-    elif 'a' in keys_pressed:
-        return "%L"
-    elif 'd' in keys_pressed:
-        return "%R"
-    else:
-        return "%"
-
-async def continuous_command_sender():
+    return CMD_TABLE_REV[keys_mask] if reversed_on else CMD_TABLE[keys_mask]
+
+KEEPALIVE_INTERVAL = 3.0  # watchdog resend when the link has been this quiet
+SPEED_DEBOUNCE = 0.03  # settle window for held speed arrows
+
+async def speed_sender():
+    # Holding an arrow fires one handler per 5-unit step; debouncing here
+    # turns a burst of adjustments into a single %NN- write.
     while True:
-        try:
-            current_command = get_command()
-            send_command_sync(current_command)
-            await asyncio.sleep(0.1)
-        except Exception as e:
-            print(f"Error: {e}")
-            await asyncio.sleep(0.1)
+        await speed_dirty.wait()
+        await asyncio.sleep(SPEED_DEBOUNCE)
+        speed_dirty.clear()
+        send_command_sync(SPEED_CMDS[current_speed])
+
+async def keepalive_watchdog():
+    # Key handlers send state changes directly; the BLE link itself is kept
+    # alive by the connection interval, so this only resends the current
+    # command when nothing has been written for a whole interval. No
+    # try/except: nothing in here raises, and cancellation should propagate.
+    while True:
+        await asyncio.sleep(KEEPALIVE_INTERVAL)
+        if time.monotonic() - last_send_ts >= KEEPALIVE_INTERVAL:
+            send_command_sync(get_command(), force=True)
+
+_display_dirty = False
 
 def update_display():
-    keys_text = "Keys currently pressed:\n" + ", ".join(sorted(keys_pressed)).upper() if keys_pressed else "Keys currently pressed:\nNone"
-    speed_text = f"Current speed: {current_speed}"
-    display_text = keys_text + "\n\n" + speed_text
-    label.config(text=display_text)
+    # Coalesce bursts of key events into one redraw per idle cycle instead
+    # of reconfiguring the label synchronously for each event.
+    global _display_dirty
+    if _display_dirty:
+        return
+    _display_dirty = True
+    root.after_idle(_do_update_display)
+
+def _do_update_display():
+    global _display_dirty
+    _display_dirty = False
+    label.config(text=f"{KEYS_TEXT[keys_mask]}\n\nCurrent speed: {current_speed}")
 
 async def command_processor():
-    global ble_client, last_command
+    # Only the GATT write itself is guarded, and only against BleakError;
+    # CancelledError propagates so shutdown stops the task immediately.
+    global ble_client, last_command, last_send_ts
     while True:
-        try:
-            command = await command_queue.get()
-            if ble_client and ble_client.is_connected:
-                try:
-                    await ble_client.write_gatt_char(CHARACTERISTIC_UUID, command.encode())
-                    if command != last_command:
-                        print(f"Sent: {command}")
-                        last_command = command
-                except Exception as e:
-                    print(f"Error sending command '{command}': {e}")
-            command_queue.task_done()
-        except Exception as e:
-            print(f"Command processor error: {e}")
-            await asyncio.sleep(0.1)
-
-def send_command_sync(command):
-    try:
-        command_queue.put_nowait(command)
-    except asyncio.QueueFull:
-        print(f"Queue full, dropping command: {command}")
+        await command_pending.wait()
+        command_pending.clear()
+        # Coalesce the burst: N queued commands become at most two GATT
+        # writes (latest speed, then latest movement).
+        movement = None
+        speed = None
+        while pending_commands:
+            command = pending_commands.popleft()
+            if command.endswith(b'-'):
+                speed = command
+            else:
+                movement = command
+        for command in (speed, movement):
+            if command is None or not (ble_client and ble_client.is_connected):
+                continue
+            try:
+                await ble_client.write_gatt_char(ble_char, command, response=ble_write_response)
+            except BleakError as e:
+                log.warning("Error sending command %s: %s", command, e)
+                continue
+            last_send_ts = time.monotonic()
+            if command != last_command:
+                log.debug("Sent: %s", command)
+                last_command = command
+
+def send_command_sync(command, force=False):
+    # Only state transitions need to hit the radio; keepalives pass force=True.
+    # Dedupe against last_enqueued (updated here, on the producer side) - the
+    # consumer-written last_command lags by a full GATT write, and comparing
+    # against it would drop a transition that arrives mid-write.
+    # The deque append is thread-safe; waking the processor is marshalled onto
+    # the BLE loop since this is usually called from the Tk main thread.
+    global last_enqueued
+    if command == last_enqueued and not force:
+        return
+    last_enqueued = command
+    pending_commands.append(command)
+    if ble_loop is not None:
+        ble_loop.call_soon_threadsafe(command_pending.set)
 
 
 def on_key_press(event):
+    global keys_mask
     key = event.keysym.lower()
     if not key or key == '??':
         return
 
-    if key in ['w', 'a', 's', 'd']:
-        if key not in keys_pressed:
-            keys_pressed.add(key)
-            update_display()
+    bit = KEY_BITS.get(key)
+    if bit and not keys_mask & bit:
+        keys_mask |= bit
+        update_display()
+        send_command_sync(get_command())
 
 def on_key_release(event):
+    global keys_mask
     key = event.keysym.lower()
     if not key or key == '??':
         return
 
-    if key in ['w', 'a', 's', 'd']:
-        if key in keys_pressed:
-            keys_pressed.discard(key)
-            update_display()
+    bit = KEY_BITS.get(key)
+    if bit and keys_mask & bit:
+        keys_mask &= ~bit
+        update_display()
+        send_command_sync(get_command())
 
 def on_key_down_arrow(event):
     global reversed_on
     reversed_on = not reversed_on
     update_display()
+    send_command_sync(get_command())
+
+def _flag_speed_changed():
+    if ble_loop is not None:
+        ble_loop.call_soon_threadsafe(speed_dirty.set)
 
 def on_key_right_arrow(event):
     global current_speed
@@ -105,8 +205,7 @@ def on_key_right_arrow(event):
     if new_speed != current_speed:
         current_speed = new_speed
         update_display()
-        speed_cmd = f"%{current_speed}-"
-        send_command_sync(speed_cmd)
+        _flag_speed_changed()
 
 def on_key_left_arrow(event):
     global current_speed
@@ -114,44 +213,38 @@ def on_key_left_arrow(event):
     if new_speed != current_speed:
         current_speed = new_speed
         update_display()
-        speed_cmd = f"%{current_speed}-"
-        send_command_sync(speed_cmd)
-
-async def tk_mainloop(window, interval=0.01):
-    while True:
-        try:
-            window.update()
-        except tk.TclError:
-            break
-        await asyncio.sleep(interval)
+        _flag_speed_changed()
 
 async def scan_and_connect():
-    global ble_client, root, label, command_sender_task
+    global ble_client, ble_char, ble_write_response, ble_loop, command_sender_task
+
+    ble_loop = asyncio.get_running_loop()
 
     print("Scanning for BLE devices...")
 
-    devices_dict = {}
+    found_evt = asyncio.Event()
+    selected_device = None
 
     def detection_callback(device, advertisement_data):
-        devices_dict[device.address] = (device, advertisement_data.rssi)
-
-    scanner = BleakScanner(detection_callback=detection_callback)
+        nonlocal selected_device
+        if selected_device is None and "JDY-16" in (device.name or ""):
+            selected_device = device
+            found_evt.set()
+
+    # Filtering on the service UUID lets the backend discard unrelated
+    # beacons in-kernel instead of invoking the callback for each one.
+    scanner = BleakScanner(
+        detection_callback=detection_callback,
+        service_uuids=[SERVICE_UUID] if SERVICE_UUID else None,
+    )
     await scanner.start()
-    await asyncio.sleep(5.0)
+    try:
+        # Stop the instant the target shows up instead of always burning 5s.
+        await asyncio.wait_for(found_evt.wait(), timeout=5.0)
+    except asyncio.TimeoutError:
+        pass
     await scanner.stop()
 
-    devices = list(devices_dict.values())
-
-    if not devices:
-        print("No devices found.")
-        return
-
-    selected_device = None
-    for device, rssi in devices:
-        if "JDY-16" in (device.name or ""):
-            selected_device = device
-            break
-
     if selected_device is None:
         print("JDY-16 not found.")
         return
@@ -168,33 +261,63 @@ async def scan_and_connect():
                     print("Service not found.")
                     return
 
-                command_processor_task = asyncio.create_task(command_processor())
+                # Resolve the characteristic once; per-write UUID lookups
+                # walk the service tree every time.
+                ble_char = client.services.get_characteristic(CHARACTERISTIC_UUID)
+                if ble_char is None:
+                    print("Characteristic not found.")
+                    return
 
-                send_command_sync("%")
+                # Write-without-response packs multiple PDUs per connection
+                # event; only fall back to confirmed writes if the
+                # characteristic doesn't support it.
+                ble_write_response = "write-without-response" not in ble_char.properties
 
-                command_sender_task = asyncio.create_task(continuous_command_sender())
+                command_processor_task = asyncio.create_task(command_processor())
 
-                root = tk.Tk()
-                root.title("WASD Command Sender")
-                root.geometry("400x200")
-                label = tk.Label(root, text=("Press WASD keys to control...\n"
-                                             "W=Forward, S=Backward, A=Left, D=Right\n"
-                                             "Arrow Keys: Down=Toggle Reverse, Left/Right=Adjust Speed"),
-                                 font=("Helvetica", 14), justify="left")
-                label.pack(expand=True, padx=20, pady=20)
+                send_command_sync(CMD_TABLE[0])
 
-                root.bind("<KeyPress>", on_key_press)
-                root.bind("<KeyRelease>", on_key_release)
-                root.bind("<Down>", on_key_down_arrow)
-                root.bind("<Right>", on_key_right_arrow)
-                root.bind("<Left>", on_key_left_arrow)
-                root.focus_set()
+                command_sender_task = asyncio.create_task(keepalive_watchdog())
+                speed_sender_task = asyncio.create_task(speed_sender())
 
-                await tk_mainloop(root)
+                # Keep the connection (and this context manager) alive for the
+                # lifetime of the process; the Tk mainloop owns the main thread.
+                await asyncio.Event().wait()
             else:
                 print("Connection failed.")
     except Exception as e:
         print(f"Error: {e}")
 
+def main():
+    global root, label
+
+    logging.basicConfig(level=logging.INFO)
+
+    # BLE/asyncio lives on a daemon worker thread; Tk gets the main thread
+    # and its native mainloop instead of a 10ms window.update() poll.
+    threading.Thread(
+        target=lambda: asyncio.run(scan_and_connect()),
+        daemon=True,
+        name="BLE-EventLoop",
+    ).start()
+
+    root = tk.Tk()
+    root.title("WASD Command Sender")
+    root.geometry("400x200")
+    label = tk.Label(root, text=("Press WASD keys to control...\n"
+                                 "W=Forward, S=Backward, A=Left, D=Right\n"
+                                 "Arrow Keys: Down=Toggle Reverse, Left/Right=Adjust Speed"),
+                     font=("Helvetica", 14), justify="left")
+    label.pack(expand=True, padx=20, pady=20)
+
+    root.bind("<KeyPress>", on_key_press)
+    root.bind("<KeyRelease>", on_key_release)
+    root.bind("<Down>", on_key_down_arrow)
+    root.bind("<Right>", on_key_right_arrow)
+    root.bind("<Left>", on_key_left_arrow)
+    root.focus_set()
+
+    root.mainloop()
+
 if __name__ == '__main__':
-    asyncio.run(scan_and_connect())
+    main()
@@ -1,5 +1,8 @@
 import asyncio
+import collections
+import logging
 import os
+import sys
 import time
 from enum import Enum
 from bleak import BleakScanner, BleakClient
@@ -8,6 +11,8 @@ from dotenv import load_dotenv
 # Load environment variables (SERVICE_UUID, CHARACTERISTIC_UUID)
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
 # --- Configuration Constants from .env ---
 SERVICE_UUID = os.getenv("SERVICE_UUID")
 CHARACTERISTIC_UUID = os.getenv("CHARACTERISTIC_UUID")
@@ -21,12 +26,19 @@ if not SERVICE_UUID or not CHARACTERISTIC_UUID:
 class CarMove(Enum):
     """
     Defines the basic movement commands for the car.
+    Values are pre-encoded bytes so the write path never calls str.encode().
     """
-    STOP = "%"
-    FRONT = "%W"
-    BACK = "%S"
-    LEFT = "%L"
-    RIGHT = "%R"
+    STOP = b"%"
+    FRONT = b"%W"
+    BACK = b"%S"
+    LEFT = b"%L"
+    RIGHT = b"%R"
+
+# Speed commands are a tiny fixed alphabet; encode them all once at import.
+_SPEED_CMDS = [f"%{i}-".encode() for i in range(101)]
+
+# Bound once so hot paths skip the enum metaclass attribute lookup.
+_STOP = CarMove.STOP
 
 class BleCarDriver:
     """
@@ -38,7 +50,14 @@ class BleCarDriver:
         self._device_name = device_name
         self._current_speed = max(0, min(100, initial_speed))
         self._ble_client = None
-        self._command_queue = asyncio.Queue()
+        # Command pipe drained in bursts by the processor, which keeps the
+        # newest movement and the newest speed command - movements are
+        # latest-wins, but a speed change must never be clobbered by one.
+        # The maxlen sheds the oldest entries if the link stalls.
+        self._pending = collections.deque(maxlen=16)
+        self._pending_evt = asyncio.Event()
+        self._char = None
+        self._loop = None
         self._command_processor_task = None
         self._last_command = None
         self._is_connecting = False
@@ -96,12 +115,26 @@ class BleCarDriver:
                     await self._ble_client.disconnect()
                     self._ble_client = None
                     return False
+
+                # Resolve the characteristic object once so every write
+                # skips the UUID -> handle lookup.
+                self._char = self._ble_client.services.get_characteristic(CHARACTERISTIC_UUID)
+                if self._char is None:
+                    print(f"Characteristic {CHARACTERISTIC_UUID} not found on device.")
+                    await self._ble_client.disconnect()
+                    self._ble_client = None
+                    return False
                 
-                # Start the command processing loop
+                # Best-effort radio tuning; the connection interval is the
+                # dominant latency knob, not anything in Python.
+                await self._tune_connection_parameters()
+
+                # Start the command processing loop on the connecting loop
+                self._loop = asyncio.get_running_loop()
                 self._command_processor_task = asyncio.create_task(self._command_processor())
                 
                 # Send initial speed command
-                self.set_speed(self._current_speed)
+                self.set_speed(self._current_speed, force=True)
                 
                 return True
             else:
@@ -115,6 +148,31 @@ class BleCarDriver:
         finally:
             self._is_connecting = False
 
+    async def _tune_connection_parameters(self):
+        """
+        Requests a short BlueZ connection interval (10-15ms instead of the
+        30-50ms default) and a larger MTU. Both are best-effort: the debugfs
+        write needs root on Linux, and not every bleak backend exposes an
+        MTU exchange. Failures are logged and ignored.
+        """
+        if sys.platform.startswith("linux") and os.geteuid() == 0:
+            try:
+                with open("/sys/kernel/debug/bluetooth/hci0/conn_min_interval", "w") as f:
+                    f.write("8")
+                with open("/sys/kernel/debug/bluetooth/hci0/conn_max_interval", "w") as f:
+                    f.write("12")
+                print("Requested 10-15ms BLE connection interval via BlueZ debugfs.")
+            except OSError as e:
+                log.debug("Could not tune connection interval: %s", e)
+
+        try:
+            exchange_mtu = getattr(self._ble_client._backend, "exchange_mtu", None)
+            if exchange_mtu is not None:
+                await exchange_mtu(247)
+                print(f"Negotiated MTU: {self._ble_client.mtu_size}")
+        except Exception as e:
+            log.debug("MTU exchange not supported: %s", e)
+
     async def disconnect(self):
         """Disconnects the BLE client and stops the command processor task."""
         if self._command_processor_task:
@@ -131,44 +189,77 @@ class BleCarDriver:
 
     # --- Command Processing ---
 
-    def _enqueue_command(self, command: str):
-        print("CMD: SET: ", command)
-        """Puts a command into the queue to be sent asynchronously."""
+    def _enqueue_command(self, command: bytes):
+        """Puts a command into the latest-wins slot to be sent asynchronously."""
+        log.debug("Enqueue command: %s", command)
         try:
-            self._command_queue.put_nowait(command)
-        except asyncio.QueueFull:
-            print(f"Queue full, dropping command: {command}")
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        # Fast path: already on the BLE loop with nothing pending, so skip
+        # the producer->consumer hop and write directly as a task.
+        if running_loop is self._loop and not self._pending and self.is_connected:
+            asyncio.create_task(self._write_direct(command))
+            return
+
+        self._pending.append(command)
+        if self._loop is not None:
+            # Safe from any thread; the Flask routes call us off-loop.
+            self._loop.call_soon_threadsafe(self._pending_evt.set)
+
+    async def _write_direct(self, command: bytes):
+        """Writes a command straight to the characteristic, bypassing the slot."""
+        try:
+            await self._ble_client.write_gatt_char(
+                self._char,
+                command,
+                response=False
+            )
+            if command != self._last_command:
+                log.debug("Sent: %s", command)
+                self._last_command = command
+        except Exception as e:
+            log.warning("Error in direct write: %s", e)
 
     async def _command_processor(self):
         """
         Asynchronously waits for commands and writes them to the BLE characteristic.
         This task runs continuously while connected.
         """
-        print('start processor')
+        # Hoist the attribute/bound-method lookups out of the loop; the
+        # client and characteristic are fixed for the life of this task.
+        pending = self._pending
+        wait = self._pending_evt.wait
+        clear = self._pending_evt.clear
+        write = self._ble_client.write_gatt_char
+        char = self._char
         while True:
             try:
-                command = await self._command_queue.get()
-                print("hi", command, self.is_connected)
-                if self.is_connected:
-                    print('connected')
-                    # Write command to the characteristic
-                    await self._ble_client.write_gatt_char(
-                        CHARACTERISTIC_UUID, 
-                        command.encode(), 
-                        response=False
-                    )
-                    print('ssss')
-                    print('self last', self._last_command)
-                    if command != self._last_command:
-                        print(f"Sent: {command}")
-                        self._last_command = command
-                        
-                self._command_queue.task_done()
+                await wait()
+                clear()
+                # Coalesce the burst: at most two writes, the newest speed
+                # command followed by the newest movement
+                movement = None
+                speed = None
+                while pending:
+                    command = pending.popleft()
+                    if command.endswith(b'-'):
+                        speed = command
+                    else:
+                        movement = command
+                for command in (speed, movement):
+                    if command is not None and self.is_connected:
+                        # Write command to the characteristic
+                        await write(char, command, response=False)
+                        if command != self._last_command:
+                            log.debug("Sent: %s", command)
+                            self._last_command = command
             except asyncio.CancelledError:
                 # Task was cancelled, exit the loop
                 break
             except Exception as e:
-                print(f"Error in command processor: {e}")
+                log.warning("Error in command processor: %s", e)
                 # Wait a bit before trying to process the next command
                 await asyncio.sleep(0.1)
 
@@ -183,36 +274,43 @@ class BleCarDriver:
         """
         if not self.is_connected:
             # Optionally raise an exception or log a warning
-            print("Warning: Not connected. Cannot send move command.")
+            log.warning("Not connected. Cannot send move command.")
             return
 
-        print('RCVD: ', direction)
-        print('V: ', direction.value)
+        log.debug("Move: %s", direction)
         # Note: The original code handles 'w' and 's' simultaneously 
         # by defaulting to the reverse of the 'reversed_on' flag.
         # Here we only handle single, direct commands from the Enum.
         self._enqueue_command(direction.value)
 
-    def set_speed(self, speed: int):
+    async def move_timed(self, direction: CarMove, duration: float):
+        """
+        Drives in the given direction for `duration` seconds, then stops.
+
+        The car's firmware has no hardware-timed move opcode, so the stop is
+        scheduled host-side; if the firmware ever grows one, this method is
+        the single place to switch to it.
+        """
+        self.move(direction)
+        await asyncio.sleep(duration)
+        self.move(_STOP)
+
+    def set_speed(self, speed: int, force: bool = False):
         """
         Sets the global speed of the car (0-100).
         This command is typically sent before any movement command.
-        
+
         Args:
             speed (int): The desired speed, clamped between 0 and 100.
+            force (bool): Resend the command even if the speed is unchanged,
+                to re-sync the car's state after e.g. a reconnect.
         """
         new_speed = max(0, min(100, speed))
-        
-        if new_speed != self._current_speed:
+
+        if new_speed != self._current_speed or force:
             self._current_speed = new_speed
-            speed_cmd = f"%{self._current_speed}-"
-            self._enqueue_command(speed_cmd)
-            print(f"Speed set to: {self._current_speed}")
-        
-        # Always send the speed command even if it's the same, 
-        # to ensure the car's state is updated if needed.
-        speed_cmd = f"%{self._current_speed}-"
-        self._enqueue_command(speed_cmd)
+            self._enqueue_command(_SPEED_CMDS[self._current_speed])
+            log.debug("Speed set to: %s", self._current_speed)
     
     def get_current_speed(self):
         """Returns the currently set speed."""
@@ -1,189 +1,345 @@
 import asyncio
 import atexit
+import logging
+import queue
 import threading
 import time
+import uuid
 import numpy as np
 import json
+from dataclasses import dataclass, field
 from enum import Enum
-from flask import Flask, jsonify, send_from_directory, request
+from flask import Flask, Response, jsonify, send_from_directory, request
 from rtl_sdr_driver import RtlSdrDriver
 from ble_car_driver import BleCarDriver, CarMove
 
+# orjson is an optional speedup for the hot status endpoint
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# uvloop (optional) swaps in a C-implemented event loop for the BLE thread
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+from logging.handlers import QueueHandler, QueueListener
+
 import os
 WEB_DIR = os.path.join(os.path.dirname(__file__), 'web')
 CONFIG_FILE = os.path.join(os.path.dirname(__file__), 'config.json')
 app = Flask(__name__, static_folder=WEB_DIR)
 
+# Buffered logging: hot threads (detection worker) only enqueue LogRecords;
+# a listener thread does the actual stdout write and flush.
+log = logging.getLogger(__name__)
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+log.addHandler(QueueHandler(_log_queue))
+log.setLevel(logging.INFO)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+def jout(obj):
+    """jsonify drop-in that serializes with orjson when it's installed."""
+    if orjson is not None:
+        return Response(orjson.dumps(obj), mimetype='application/json')
+    return jsonify(obj)
+
 # --- Config File Management ---
+# Parsed-config cache: the status endpoint and every detection step used to
+# reopen and reparse config.json. Re-read only when the file's mtime changes
+# or the entry goes stale.
+_config_cache = {'data': None, 'mtime': None, 'loaded_at': 0.0}
+CONFIG_CACHE_TTL_SECONDS = 60
+
 def load_config():
-    """Load configuration from config.json file."""
+    """Load configuration from config.json file (cached on mtime + TTL)."""
     default_config = {'rotation_duration': 0.3, 'measurement_time': 0.5, 'speed': 15}
+    now = time.monotonic()
     try:
-        if os.path.exists(CONFIG_FILE):
+        mtime = os.path.getmtime(CONFIG_FILE)
+    except OSError:
+        mtime = None
+
+    if (_config_cache['data'] is not None
+            and mtime == _config_cache['mtime']
+            and now - _config_cache['loaded_at'] < CONFIG_CACHE_TTL_SECONDS):
+        return _config_cache['data']
+
+    config = default_config
+    try:
+        if mtime is not None:
             with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
                 # Merge with defaults to ensure all keys exist
-                return {**default_config, **config}
+                config = {**default_config, **json.load(f)}
     except Exception as e:
         print(f"Error loading config: {e}")
-    return default_config
+
+    _config_cache['data'] = config
+    _config_cache['mtime'] = mtime
+    _config_cache['loaded_at'] = now
+    return config
 
 def save_config(config):
     """Save configuration to config.json file."""
     try:
         with open(CONFIG_FILE, 'w') as f:
             json.dump(config, f, indent=4)
+        # Keep the cache authoritative so readers never reparse what we just wrote
+        _config_cache['data'] = config
+        _config_cache['mtime'] = os.path.getmtime(CONFIG_FILE)
+        _config_cache['loaded_at'] = time.monotonic()
         return True
     except Exception as e:
         print(f"Error saving config: {e}")
         return False
 
-# Global state to share data between the main Flask thread and background tasks
-global_state = {
-    'car_connected': False,
-    'sdr_ready': False,
-    'detection_running': False,
-    'detection_results': {}, # {angle: power_dB, ...}
-    'current_angle': 0, # Current simulated rotation angle
-}
+# --- Configuration ---
+WATCH_FREQ_MHZ = 433.4
+SAMPLE_RATE_HZ = 1024000
+ROTATION_STEP_DEGREES = 45 # How many degrees to turn per step in detection cycle
+MEASUREMENT_TIME_SECONDS = 0.5 # How long to measure at each position
+TOTAL_STEPS = 8  # 0, 45, 90, 135, 180, 225, 270, 315 degrees (360° scan)
+
+# Results are stored quantized to hundredths of a dB in int16 (0.01 dB
+# resolution over +/-327 dB covers the SDR's dynamic range many times over);
+# the sentinel marks angles not yet measured.
+RESULT_NOT_MEASURED = np.iinfo(np.int16).min
+
+def _new_results_array():
+    """Preallocated per-step result storage (int16 dB*100)."""
+    return np.full(TOTAL_STEPS, RESULT_NOT_MEASURED, dtype=np.int16)
+
+def _results_to_dict(results):
+    """Converts the step-indexed array to the {angle: dB} dict the UI expects.
+
+    Values are rounded to one decimal for transport; 0.1 dB is already below
+    measurement noise and keeps the polled payload short.
+    """
+    # Keys must be strings: orjson rejects non-str dict keys, and the
+    # frontend iterates with Object.entries, which stringifies anyway.
+    return {str(step * ROTATION_STEP_DEGREES): round(int(power) / 100.0, 1)
+            for step, power in enumerate(results) if power != RESULT_NOT_MEASURED}
+
+# Global state to share data between the main Flask thread and background tasks.
+# A slotted dataclass: attribute access is a C-level slot load instead of a
+# string-keyed dict lookup on every status poll.
+@dataclass(slots=True)
+class GlobalState:
+    car_connected: bool = False
+    sdr_ready: bool = False
+    detection_running: bool = False
+    # int16 dB*100 per step, RESULT_NOT_MEASURED sentinel when missing
+    detection_results: np.ndarray = field(default_factory=_new_results_array)
+    current_angle: int = 0  # Current simulated rotation angle
+    version: int = 0  # Bumped on every visible change; feeds the status ETag
+    job_id: str = ''  # Identifies the current/most recent detection run
+
+global_state = GlobalState()
+
+# Guards multi-field publishes to global_state: individual attribute writes
+# are GIL-atomic, but the status endpoint must not see torn angle/result pairs.
+state_lock = threading.Lock()
+
+def bump_state_version():
+    """Marks the shared state as changed so status polls see a new ETag."""
+    global_state.version += 1
+
+# Direction-name -> CarMove lookup, precomputed so the move route does one
+# dict get instead of str.upper() + Enum __getitem__ (and its KeyError path).
+_MOVE_MAP = {name.lower(): member for name, member in CarMove.__members__.items()}
+
+# Bound once: CarMove.X goes through the enum metaclass on every attribute
+# access, so the two members the detection path uses are cached here.
+_RIGHT = CarMove.RIGHT
+_STOP = CarMove.STOP
 
 # Driver instances
 car_driver = None
 sdr_driver = None
-DETECTION_THREAD = None
-
-# Dedicated event loop for BLE operations (runs in its own thread)
-ble_loop = None
-ble_thread = None
-ble_loop_ready = threading.Event()  # Synchronization primitive
-
-def start_ble_event_loop():
-    """Runs the dedicated BLE event loop in a background thread."""
-    global ble_loop
-    ble_loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(ble_loop)
-    ble_loop_ready.set()  # Signal that loop is ready
-    print("BLE event loop started and ready")
-    ble_loop.run_forever()
-
-def ensure_ble_loop_running():
-    """Ensures BLE event loop thread is running. Call before any BLE operation."""
-    global ble_thread
-    if ble_thread is None or not ble_thread.is_alive():
-        ble_loop_ready.clear()
-        ble_thread = threading.Thread(target=start_ble_event_loop, daemon=True, name="BLE-EventLoop")
-        ble_thread.start()
-        # Wait for loop to actually be running (max 5s)
-        if not ble_loop_ready.wait(timeout=5.0):
-            raise RuntimeError("BLE event loop failed to start")
-        print(f"BLE thread started: {ble_thread.name}, alive={ble_thread.is_alive()}")
+
+# Cancellation signal for the detection cycle; set from the stop route,
+# polled by the cycle's waits for sub-second aborts.
+detection_cancel = threading.Event()
+
+# Continuous SDR sampler: one daemon thread owns the dongle and appends
+# (monotonic timestamp, dB) pairs to a ring; the detection cycle and the
+# status endpoint slice the ring instead of competing for the device. This
+# also lets the radio keep sampling while the car is rotating.
+SDR_RING_SIZE = 256
+SDR_SAMPLES_PER_READ = 16384
+sdr_ring_ts = np.zeros(SDR_RING_SIZE)
+sdr_ring_db = np.full(SDR_RING_SIZE, np.nan, dtype=np.float32)
+sdr_ring_idx = 0
+sdr_sampler_thread = None
+
+def _sdr_sampler_loop():
+    """Continuously measures power into the ring buffer."""
+    global sdr_ring_idx
+    while True:
+        driver = sdr_driver  # snapshot: shutdown detaches the global
+        if driver is None:
+            break
+        power = driver.watch(SDR_SAMPLES_PER_READ)
+        slot = sdr_ring_idx % SDR_RING_SIZE
+        sdr_ring_db[slot] = power
+        sdr_ring_ts[slot] = time.monotonic()
+        sdr_ring_idx += 1
+
+def ensure_sdr_sampler_running():
+    """Starts the background SDR sampler thread on first use."""
+    global sdr_sampler_thread
+    if sdr_sampler_thread is None or not sdr_sampler_thread.is_alive():
+        sdr_sampler_thread = threading.Thread(
+            target=_sdr_sampler_loop, daemon=True, name="SDR-Sampler")
+        sdr_sampler_thread.start()
+
+def _latest_live_db():
+    """Returns the most recent ring reading (falls back to a direct read)."""
+    if sdr_sampler_thread is not None and sdr_ring_idx > 0:
+        return float(sdr_ring_db[(sdr_ring_idx - 1) % SDR_RING_SIZE])
+    return float(sdr_driver.watch())
+
+# Dedicated event loop for BLE operations, created once at import and run
+# forever on a daemon thread. Creating it eagerly removes the per-request
+# liveness checks and the restart races of a lazily started loop.
+ble_loop = asyncio.new_event_loop()
+ble_thread = threading.Thread(target=ble_loop.run_forever, daemon=True, name="BLE-EventLoop")
+ble_thread.start()
 
 def run_in_ble_loop(coro):
     """Schedule a coroutine in the BLE thread's event loop and wait for result."""
-    ensure_ble_loop_running()
-    if ble_loop is None or not ble_loop.is_running():
-        raise RuntimeError("BLE event loop is not running")
     future = asyncio.run_coroutine_threadsafe(coro, ble_loop)
     return future.result(timeout=30)  # 30s timeout for BLE operations
 
+def fire_in_ble_loop(coro):
+    """Schedule a coroutine in the BLE loop without waiting for its result.
+
+    Fire-and-forget commands (move, speed) don't need to hold the Flask
+    worker hostage for the whole BLE round-trip; only operations whose
+    outcome the caller reports (connect, detection steps) should block.
+    Returns the concurrent future so callers may cancel a superseded op.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, ble_loop)
+
 def shutdown_ble():
     """Gracefully shutdown BLE: disconnect car, stop event loop, join thread."""
-    global ble_loop, ble_thread, car_driver
-    
     print("Shutting down BLE...")
-    
+
     # Disconnect car if connected
     if car_driver and car_driver.is_connected:
         try:
             run_in_ble_loop(car_driver.disconnect())
         except Exception as e:
             print(f"Error disconnecting car: {e}")
-    
+
     # Stop the event loop
-    if ble_loop and ble_loop.is_running():
+    if ble_loop.is_running():
         ble_loop.call_soon_threadsafe(ble_loop.stop)
-    
+
     # Wait for thread to finish
-    if ble_thread and ble_thread.is_alive():
+    if ble_thread.is_alive():
         ble_thread.join(timeout=2.0)
         print(f"BLE thread joined: alive={ble_thread.is_alive()}")
-    
-    ble_loop = None
-    ble_thread = None
+
     print("BLE shutdown complete")
 
 atexit.register(shutdown_ble)
 
-# --- Configuration ---
-WATCH_FREQ_MHZ = 433.4
-SAMPLE_RATE_HZ = 1024000
-ROTATION_STEP_DEGREES = 45 # How many degrees to turn per step in detection cycle
-MEASUREMENT_TIME_SECONDS = 0.5 # How long to measure at each position
-TOTAL_STEPS = 8  # 0, 45, 90, 135, 180, 225, 270, 315 degrees (360° scan)
+def shutdown_sdr():
+    """Closes the SDR explicitly; __del__-based teardown is unreliable and
+    a leaked USB handle makes the next init_drivers hard-exit."""
+    global sdr_driver
+    driver, sdr_driver = sdr_driver, None  # stop the sampler loop first
+    if driver is not None:
+        driver.close()
+
+atexit.register(shutdown_sdr)
 
 # ====================================================================
 # 3. BACKGROUND TASK LOGIC (Detection Cycle)
 # ====================================================================
 
-def run_detection_cycle():
+async def _wait_or_cancel(timeout):
+    """Waits out `timeout` seconds on the BLE loop; True if cancel was requested."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if detection_cancel.is_set():
+            return True
+        await asyncio.sleep(min(0.05, deadline - time.monotonic()))
+    return detection_cancel.is_set()
+
+async def run_detection_cycle():
     """
-    Background function run in a separate thread to handle the
-    synchronous SDR watch and asynchronous car move operations.
+    Runs the scan as a coroutine on the BLE event loop: car moves are plain
+    awaits (no cross-thread future per step) and the SDR data comes from the
+    sampler thread's ring, so nothing here blocks the loop.
     """
-    global global_state, car_driver, sdr_driver
-    
+    global car_driver, sdr_driver
+
     if not car_driver.is_connected or not sdr_driver:
-        print("ERROR: Drivers not ready for detection.")
-        global_state['detection_running'] = False
+        log.error("Drivers not ready for detection.")
+        global_state.detection_running = False
         return
 
-    print("--- STARTING DETECTION CYCLE ---")
-    global_state['detection_results'] = {}
+    log.info("--- STARTING DETECTION CYCLE ---")
+    global_state.detection_results = _new_results_array()
     config = load_config()
     
     # Use a loop to perform the 360-degree scan
     for step in range(TOTAL_STEPS):
-        if not global_state['detection_running']:
+        if detection_cancel.is_set() or not global_state.detection_running:
             break # Stop if requested
 
         current_angle = step * ROTATION_STEP_DEGREES
-        global_state['current_angle'] = current_angle
-        print(f"Detection: Step {step+1}/{TOTAL_STEPS} at {current_angle}°")
-
-        # 1. SDR Measurement FIRST: Measure at current position
+        with state_lock:
+            global_state.current_angle = current_angle
+            bump_state_version()
+        log.info("Detection: Step %d/%d at %d°", step + 1, TOTAL_STEPS, current_angle)
+
+        # 1. SDR Measurement FIRST: the background sampler keeps feeding the
+        # ring, so measuring is just waiting out the window and slicing the
+        # readings that fall inside it. The Event wait doubles as an
+        # interruptible sleep for cancellation.
         measurement_time = config.get('measurement_time', 0.5)
-        readings = []
-        start_time = time.time()
-        while time.time() - start_time < measurement_time:
-            power = sdr_driver.watch()
-            readings.append(power)
-        
+        window_start = time.monotonic()
+        if await _wait_or_cancel(measurement_time):
+            break
+        window_end = time.monotonic()
+        window_mask = (sdr_ring_ts >= window_start) & (sdr_ring_ts <= window_end)
+        window = sdr_ring_db[window_mask]
+
         # 2. Process and Store Result
-        if readings:
-            avg_power = np.mean(readings)
-            global_state['detection_results'][current_angle] = round(avg_power, 2)
-            print(f"Result at {current_angle}°: {avg_power:.2f} dB")
+        if window.size:
+            avg_power = float(window.mean())
+            with state_lock:
+                global_state.detection_results[step] = int(round(avg_power * 100))
+                bump_state_version()
+            log.info("Result at %d°: %.2f dB", current_angle, avg_power)
         
         # 3. Car Movement AFTER: Rotate to the next position (always rotate, including last step to return to 0°)
         rotation_duration = config.get('rotation_duration', 0.3)
         try:
-            run_in_ble_loop(async_move_and_wait(CarMove.RIGHT, rotation_duration))
+            await car_driver.move_timed(_RIGHT, rotation_duration)
         except Exception as e:
-            print(f"BLE ERROR during move: {e}")
-            global_state['detection_running'] = False
+            log.error("BLE ERROR during move: %s", e)
+            global_state.detection_running = False
             break
         
-        time.sleep(0.1) # Brief pause before next measurement
-
-    global_state['detection_running'] = False
-    print("--- DETECTION CYCLE COMPLETE - Returned to 0° ---")
-
-async def async_move_and_wait(direction, duration):
-    """Helper to run async car commands."""
-    car_driver.move(direction)
-    await asyncio.sleep(duration)
-    car_driver.move(CarMove.STOP)
+        # Optional settle pause before the next measurement; defaults to none.
+        # Waiting on the cancel event keeps the pause interruptible.
+        step_pause = config.get('step_pause', 0.0)
+        if step_pause > 0 and await _wait_or_cancel(step_pause):
+            break
 
+    with state_lock:
+        global_state.detection_running = False
+        bump_state_version()
+    log.info("--- DETECTION CYCLE COMPLETE - Returned to 0° ---")
 
 # ====================================================================
 # 4. FLASK ROUTES
@@ -192,53 +348,58 @@ async def async_move_and_wait(direction, duration):
 @app.route('/api/init_drivers', methods=['POST'])
 def init_drivers():
     """Initializes and connects the car and SDR drivers."""
-    global car_driver, sdr_driver, global_state
+    global car_driver, sdr_driver
     
     try:
-        # Ensure BLE event loop is running (handles thread creation/restart)
-        ensure_ble_loop_running()
-        
         # Initialize SDR (synchronous)
         sdr_driver = RtlSdrDriver(WATCH_FREQ_MHZ, SAMPLE_RATE_HZ, 0)
-        global_state['sdr_ready'] = True
+        global_state.sdr_ready = True
+        ensure_sdr_sampler_running()
 
         # Initialize and connect Car (in the dedicated BLE event loop)
         car_driver = BleCarDriver()
         connect_success = run_in_ble_loop(car_driver.connect())
         
         if connect_success:
-            global_state['car_connected'] = True
+            global_state.car_connected = True
             # Apply saved speed from config
             config = load_config()
             saved_speed = config.get('speed', 15)
             car_driver.set_speed(saved_speed)
             print(f"Applied saved speed: {saved_speed}%")
-            return jsonify({'status': 'success', 'message': f'Drivers initialized and car connected. Speed set to {saved_speed}%.'})
+            return jout({'status': 'success', 'message': f'Drivers initialized and car connected. Speed set to {saved_speed}%.'})
         else:
-            global_state['sdr_ready'] = False
-            return jsonify({'status': 'error', 'message': 'SDR initialized, but failed to connect car.'})
+            global_state.sdr_ready = False
+            return jout({'status': 'error', 'message': 'SDR initialized, but failed to connect car.'})
             
     except Exception as e:
-        return jsonify({'status': 'error', 'message': f'Initialization failed: {e}'})
+        return jout({'status': 'error', 'message': f'Initialization failed: {e}'})
 
 
+# In-flight manual move, so a newer WASD command replaces the previous one
+# (latest-wins) instead of stacking timed moves and their stops.
+_move_future = None
+
 @app.route('/api/move/<direction>', methods=['POST'])
 def move_car(direction):
     """Handles WASD control commands."""
-    global car_driver
+    global car_driver, _move_future
     
-    if not global_state['car_connected']:
-        return jsonify({'status': 'error', 'message': 'Car not connected.'})
+    if not global_state.car_connected:
+        return jout({'status': 'error', 'message': 'Car not connected.'})
         
+    move_command = _MOVE_MAP.get(direction.lower())
+    if move_command is None:
+        return jout({'status': 'error', 'message': 'Invalid direction.'})
+
     try:
-        move_command = CarMove[direction.upper()]
-        run_in_ble_loop(async_move_and_wait(move_command, 1))
-        
-        return jsonify({'status': 'success', 'message': f'Car moved {direction}.'})
-    except KeyError:
-        return jsonify({'status': 'error', 'message': 'Invalid direction.'})
+        if _move_future is not None and not _move_future.done():
+            _move_future.cancel()
+        _move_future = fire_in_ble_loop(car_driver.move_timed(move_command, 1))
+
+        return jout({'status': 'success', 'message': f'Car moved {direction}.'})
     except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)})
+        return jout({'status': 'error', 'message': str(e)})
 
 
 @app.route('/api/speed/<int:value>', methods=['POST'])
@@ -246,8 +407,8 @@ def set_speed(value):
     """Sets car speed (0-100)."""
     global car_driver
     
-    if not global_state['car_connected']:
-        return jsonify({'status': 'error', 'message': 'Car not connected.'})
+    if not global_state.car_connected:
+        return jout({'status': 'error', 'message': 'Car not connected.'})
     
     try:
         car_driver.set_speed(value)
@@ -255,60 +416,73 @@ def set_speed(value):
         config = load_config()
         config['speed'] = value
         save_config(config)
-        return jsonify({'status': 'success', 'speed': car_driver.get_current_speed()})
+        return jout({'status': 'success', 'speed': car_driver.get_current_speed()})
     except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)})
+        return jout({'status': 'error', 'message': str(e)})
 
 
 @app.route('/api/speed', methods=['GET'])
 def get_speed():
     """Gets current car speed."""
     if not car_driver:
-        return jsonify({'status': 'error', 'speed': 0})
-    return jsonify({'status': 'success', 'speed': car_driver.get_current_speed()})
+        return jout({'status': 'error', 'speed': 0})
+    return jout({'status': 'success', 'speed': car_driver.get_current_speed()})
 
 
 @app.route('/api/detect/start', methods=['POST'])
 def start_detection():
     """Starts the signal detection background thread."""
-    global global_state, DETECTION_THREAD
-    
-    if global_state['detection_running']:
-        return jsonify({'status': 'error', 'message': 'Detection is already running.'})
-        
-    if not global_state['car_connected'] or not global_state['sdr_ready']:
-        return jsonify({'status': 'error', 'message': 'Drivers are not ready. Initialize first.'})
-
-    global_state['detection_running'] = True
-    global_state['detection_results'] = {}
-    
-    # Start the detection loop in a new thread to avoid blocking Flask
-    DETECTION_THREAD = threading.Thread(target=run_detection_cycle)
-    DETECTION_THREAD.start()
-    
-    return jsonify({'status': 'running', 'message': 'Detection cycle started in background.'})
+    if not global_state.car_connected or not global_state.sdr_ready:
+        return jout({'status': 'error', 'message': 'Drivers are not ready. Initialize first.'})
+
+    # Check-and-set under the lock: two racing start requests must not both
+    # observe detection_running False and enqueue two cycles against one SDR.
+    with state_lock:
+        if global_state.detection_running:
+            # Idempotent-ish: point the caller at the run already in flight
+            response = jout({'status': 'error', 'message': 'Detection is already running.',
+                             'job_id': global_state.job_id})
+            response.status_code = 409
+            return response
+        global_state.detection_running = True
+        global_state.detection_results = _new_results_array()
+        global_state.job_id = uuid.uuid4().hex
+        job_id = global_state.job_id
+        bump_state_version()
+    detection_cancel.clear()
+
+    # The cycle runs as a task on the BLE loop; no worker thread involved
+    fire_in_ble_loop(run_detection_cycle())
+
+    response = jout({'status': 'running', 'job_id': job_id,
+                     'message': 'Detection cycle started in background.'})
+    response.status_code = 202
+    return response
 
 
 @app.route('/api/detect/stop', methods=['POST'])
 def stop_detection():
     """Stops the detection cycle and clears results."""
-    global global_state
-    
-    if global_state['detection_running']:
-        global_state['detection_running'] = False
-        global_state['detection_results'] = {}
-        return jsonify({'status': 'success', 'message': 'Detection stopped and results cleared.'})
+    if global_state.detection_running:
+        detection_cancel.set()
+        with state_lock:
+            global_state.detection_running = False
+            global_state.detection_results = _new_results_array()
+            bump_state_version()
+        return jout({'status': 'success', 'message': 'Detection stopped and results cleared.'})
     else:
-        global_state['detection_results'] = {}
-        return jsonify({'status': 'success', 'message': 'Results cleared.'})
+        with state_lock:
+            global_state.detection_results = _new_results_array()
+            bump_state_version()
+        return jout({'status': 'success', 'message': 'Results cleared.'})
 
 @app.route('/api/calibrate', methods=['POST'])
 def calibrate():
     """Rotates the car for a specified duration (in seconds) for calibration purposes."""
     global car_driver
     
-    if not global_state['car_connected']:
-        return jsonify({'status': 'error', 'message': 'Car not connected.'})
+    if not global_state.car_connected:
+        return jout({'status': 'error', 'message': 'Car not connected.'})
     
     try:
         data = request.get_json()
@@ -316,10 +490,10 @@ def calibrate():
         save_to_config = data.get('save', True)  # By default, save to config
         
         if duration <= 0 or duration > 30:
-            return jsonify({'status': 'error', 'message': 'Duration must be between 0 and 30 seconds.'})
+            return jout({'status': 'error', 'message': 'Duration must be between 0 and 30 seconds.'})
         
         # Rotate the car to the right for the specified duration (same as triangulation)
-        run_in_ble_loop(async_move_and_wait(CarMove.RIGHT, duration))
+        run_in_ble_loop(car_driver.move_timed(_RIGHT, duration))
         
         # Save rotation_duration to config file if requested
         if save_to_config:
@@ -327,41 +501,74 @@ def calibrate():
             config['rotation_duration'] = duration
             save_config(config)
         
-        return jsonify({'status': 'success', 'message': f'Calibration rotation completed for {duration} seconds.', 'saved': save_to_config})
+        return jout({'status': 'success', 'message': f'Calibration rotation completed for {duration} seconds.', 'saved': save_to_config})
     except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)})
+        return jout({'status': 'error', 'message': str(e)})
 
 
+# Live-dB cache: the status endpoint serves the last reading instead of
+# touching the SDR on every poll.
+_live_db_cache = {'value': None, 'read_at': 0.0}
+LIVE_DB_MIN_INTERVAL = 0.2
+
 @app.route('/api/detect/status', methods=['GET'])
 def get_detection_status():
     """Endpoint for the frontend to poll for status and results."""
     current_db = None
-    if sdr_driver and global_state['sdr_ready']:
-        try:
-            current_db = round(sdr_driver.watch(), 2)
-        except:
-            pass
-    
+    if sdr_driver and global_state.sdr_ready:
+        now = time.monotonic()
+        if now - _live_db_cache['read_at'] >= LIVE_DB_MIN_INTERVAL:
+            try:
+                _live_db_cache['value'] = round(_latest_live_db(), 2)
+            except:
+                pass
+            _live_db_cache['read_at'] = now
+        current_db = _live_db_cache['value']
+
+    # The ETag covers the state version plus the live reading, so unchanged
+    # polls skip serialization and transfer entirely. Snapshot under the lock
+    # so the angle/results/running fields are mutually consistent.
+    with state_lock:
+        etag = f"{global_state.version}-{current_db}"
+        # if_none_match handles the quoting set_etag applies (clients echo
+        # '"12-..."'), plus multi-value and weak forms; a raw header compare
+        # never matches and would make this path dead code.
+        if request.if_none_match.contains(etag):
+            return Response(status=304)
+        snapshot = GlobalState(
+            car_connected=global_state.car_connected,
+            sdr_ready=global_state.sdr_ready,
+            detection_running=global_state.detection_running,
+            detection_results=global_state.detection_results.copy(),
+            current_angle=global_state.current_angle,
+            version=global_state.version,
+            job_id=global_state.job_id,
+        )
+
     config = load_config()
-    return jsonify({
-        'running': global_state['detection_running'],
-        'results': global_state['detection_results'],
-        'car_connected': global_state['car_connected'],
-        'sdr_ready': global_state['sdr_ready'],
+    payload = {
+        'running': snapshot.detection_running,
+        'results': _results_to_dict(snapshot.detection_results),
+        'car_connected': snapshot.car_connected,
+        'sdr_ready': snapshot.sdr_ready,
         'current_db': current_db,
         'rotation_duration': config.get('rotation_duration', 0.3),
         'measurement_time': config.get('measurement_time', 0.5),
-        'current_angle': global_state.get('current_angle', 0),
+        'current_angle': snapshot.current_angle,
+        'job_id': snapshot.job_id,
         'total_steps': TOTAL_STEPS,
         'step_degrees': ROTATION_STEP_DEGREES
-    })
+    }
+    response = jout(payload)
+    response.set_etag(etag)
+    return response
 
 
 @app.route('/api/config', methods=['GET'])
 def get_config():
     """Returns the saved configuration."""
     config = load_config()
-    return jsonify({'status': 'success', 'config': config})
+    return jout({'status': 'success', 'config': config})
 
 
 @app.route('/api/settings', methods=['POST'])
@@ -382,9 +589,9 @@ def save_settings():
                 config['measurement_time'] = measurement_time
         
         save_config(config)
-        return jsonify({'status': 'success', 'message': 'Settings saved.', 'config': config})
+        return jout({'status': 'success', 'message': 'Settings saved.', 'config': config})
     except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)})
+        return jout({'status': 'error', 'message': str(e)})
 
 
 @app.route('/api/login', methods=['POST'])
@@ -397,24 +604,35 @@ def login():
         correct_password = config.get('password', 'car123')
         
         if password == correct_password:
-            return jsonify({'status': 'success', 'message': 'Login successful'})
+            return jout({'status': 'success', 'message': 'Login successful'})
         else:
-            return jsonify({'status': 'error', 'message': 'Incorrect password'})
+            return jout({'status': 'error', 'message': 'Incorrect password'})
     except Exception as e:
-        return jsonify({'status': 'error', 'message': str(e)})
+        return jout({'status': 'error', 'message': str(e)})
 
 
 @app.route('/')
 def index():
-    """Serves the main HTML page."""
-    return send_from_directory(WEB_DIR, 'index.html')
+    """Serves the main HTML page (always revalidated, 304 when unchanged)."""
+    return send_from_directory(WEB_DIR, 'index.html', max_age=0, conditional=True)
 
 @app.route('/<path:filename>')
 def static_files(filename):
-    """Serves static files (JS, CSS, etc.)."""
-    return send_from_directory(WEB_DIR, filename)
+    """Serves static files (JS, CSS, etc.) with an hour of browser caching."""
+    return send_from_directory(WEB_DIR, filename, max_age=3600, conditional=True)
 
 if __name__ == '__main__':
     # Start the Flask app
-    # host='0.0.0.0' allows access from other devices on the network
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    # host='0.0.0.0' allows access from other devices on the network.
+    # Prefer waitress (threaded production server); the debug reloader ran a
+    # second process and served requests one at a time, so every status poll
+    # queued behind any in-flight BLE move.
+    # Debug mode stays available for development behind an explicit env var.
+    if os.environ.get('BLE_CAR_DEBUG'):
+        app.run(host='0.0.0.0', port=5000, debug=True)
+    else:
+        try:
+            from waitress import serve
+            serve(app, host='0.0.0.0', port=5000, threads=8)
+        except ImportError:
+            app.run(host='0.0.0.0', port=5000, threaded=True)
\ No newline at end of file
@@ -11,21 +11,25 @@ if __name__ == "__main__":
     
     print(f"Watching {WATCH_FREQ_MHZ} MHz... Press Ctrl+C to stop.")
     
-    # Storage for averaging
-    readings = []
-    last_print_time = time.time()
-    
+    # Preallocated storage for averaging: one float32 slot per reading
+    # instead of growing a Python list and reconverting it every second.
+    READINGS_CAPACITY = 4096
+    readings = np.empty(READINGS_CAPACITY, dtype=np.float32)
+    reading_count = 0
+    next_print_ns = time.monotonic_ns() + 1_000_000_000
+
     try:
         while True:
-            # Get the power of the signal
-            power = driver.watch()
-            readings.append(power)
-            
-            # Check if 1 second has passed
-            current_time = time.time()
-            if current_time - last_print_time >= 1.0:
-                if readings:
-                    avg_power = np.mean(readings)
+            # Get the power of the signal (linear; dB conversion happens
+            # once per printed average, not once per chunk)
+            if reading_count < READINGS_CAPACITY:
+                readings[reading_count] = driver.watch_linear()
+                reading_count += 1
+
+            # Check if 1 second has passed (monotonic: immune to clock jumps)
+            if time.monotonic_ns() >= next_print_ns:
+                if reading_count:
+                    avg_power = 10 * np.log10(float(readings[:reading_count].mean()) + 1e-20)
                     
                     # Simple visualization
                     bar_length = int(avg_power + 100) // 2 
@@ -34,8 +38,8 @@ if __name__ == "__main__":
                     print(f"Average Power (1s): {avg_power:.2f} dB  [{bar}]")
                 
                 # Reset buffer and timer
-                readings = []
-                last_print_time = current_time
+                reading_count = 0
+                next_print_ns = time.monotonic_ns() + 1_000_000_000
             
     except KeyboardInterrupt:
         print("\nStopping...")
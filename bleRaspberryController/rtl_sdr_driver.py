@@ -18,18 +18,22 @@ class RtlSdrDriver:
         self.frequency_mhz = watch_frequency_mhz
         self.sample_rate = sample_rate
         self.sdr = None
+        # Reusable complex64 scratch buffer for watch(); pyrtlsdr's
+        # read_samples always allocates its own complex128 array, but the
+        # narrowing copy can at least land in the same storage every call.
+        self._cast_buf = None
+        # Deferred buffer flush/gain settle: doing it here added a blocking
+        # read to init_drivers, which already waits on the BLE connect.
+        self._flushed = False
 
         try:
             self.sdr = RtlSdr()
-            
+
             # Configure the SDR
             self.sdr.sample_rate = self.sample_rate
             self.sdr.center_freq = self.frequency_mhz * 1e6  # Convert MHz to Hz
             self.sdr.gain = gain
-            
-            # Read a few samples to flush buffers and let gain settle
-            self.sdr.read_samples(256)
-            
+
             print(f"RtlSdrDriver initialized.")
             print(f" - Frequency: {self.frequency_mhz} MHz")
             print(f" - Sample Rate: {self.sample_rate} Hz")
@@ -42,37 +46,54 @@ class RtlSdrDriver:
                 self.sdr.close()
             sys.exit(1)
 
-    def watch(self, num_samples=4096):
+    def watch_linear(self, num_samples=4096):
         """
-        Reads a chunk of samples from the SDR and calculates the relative signal power.
+        Reads a chunk of samples and returns the relative signal power on the
+        linear scale. Callers that average many readings can accumulate these
+        and convert to dB once, instead of paying a log10 per chunk.
 
         Args:
             num_samples (int): Number of samples to read for the measurement (power of 2 recommended).
 
         Returns:
-            float: Relative signal power in Decibels (dB).
+            float: Relative linear signal power.
         """
         if not self.sdr:
             raise RuntimeError("SDR device not initialized.")
 
         try:
+            # Flush buffers / let gain settle on the first read only
+            if not self._flushed:
+                self.sdr.read_samples(256)
+                self._flushed = True
+
             # Read complex IQ samples
             samples = self.sdr.read_samples(num_samples)
-            
-            # Calculate power: Mean of the magnitude squared of the complex samples
-            # We use numpy for efficient calculation
-            # P = |I + jQ|^2
-            power_linear = np.mean(np.abs(samples)**2)
-            
-            # Convert to Decibels (dB)
-            # Add a small epsilon to avoid log(0)
-            power_db = 10 * np.log10(power_linear + 1e-20)
-            
-            return power_db
+
+            # Calculate power: mean of |I + jQ|^2. vdot computes the whole
+            # sum in one fused kernel instead of materializing abs() and
+            # squared intermediates, and complex64 halves the bytes scanned.
+            if self._cast_buf is None or self._cast_buf.size != samples.size:
+                self._cast_buf = np.empty(samples.size, dtype=np.complex64)
+            self._cast_buf[:] = samples  # narrowing copy, no fresh allocation
+            return float(np.vdot(self._cast_buf, self._cast_buf).real / samples.size)
 
         except Exception as e:
             print(f"Error reading samples: {e}")
-            return -100.0 # Return noise floor value on error
+            return 1e-10 # Noise-floor value (-100 dB) on error
+
+    def watch(self, num_samples=4096):
+        """
+        Reads a chunk of samples from the SDR and calculates the relative signal power.
+
+        Args:
+            num_samples (int): Number of samples to read for the measurement (power of 2 recommended).
+
+        Returns:
+            float: Relative signal power in Decibels (dB).
+        """
+        # Add a small epsilon to avoid log(0)
+        return 10 * np.log10(self.watch_linear(num_samples) + 1e-20)
 
     def close(self):
         """
@@ -83,5 +104,8 @@ class RtlSdrDriver:
             self.sdr = None
             print("RTL-SDR device closed.")
 
-    def __del__(self):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
         self.close()
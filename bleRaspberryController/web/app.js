@@ -66,6 +66,29 @@ checkLoginStatus();
 
 const canvas = document.getElementById('polarCanvas');
 const ctx = canvas.getContext('2d');
+
+// Static polar grid rendered once to an offscreen canvas; every redraw just
+// blits it instead of re-stroking the circles and axes.
+const gridCanvas = document.createElement('canvas');
+gridCanvas.width = canvas.width;
+gridCanvas.height = canvas.height;
+(function drawPolarGrid() {
+    const gctx = gridCanvas.getContext('2d');
+    const size = gridCanvas.width;
+    const center = size / 2;
+    const radius = size * 0.45;
+    gctx.strokeStyle = '#ccc';
+    gctx.lineWidth = 1;
+    gctx.beginPath();
+    gctx.arc(center, center, radius / 3, 0, 2 * Math.PI);
+    gctx.arc(center, center, radius * 2 / 3, 0, 2 * Math.PI);
+    gctx.arc(center, center, radius, 0, 2 * Math.PI);
+    gctx.moveTo(center, center); gctx.lineTo(center, center - radius); // 90
+    gctx.moveTo(center, center); gctx.lineTo(center, center + radius); // 270
+    gctx.moveTo(center, center); gctx.lineTo(center + radius, center); // 0
+    gctx.moveTo(center, center); gctx.lineTo(center - radius, center); // 180
+    gctx.stroke();
+})();
 const statusIndicators = {
     car: document.getElementById('carStatus'),
     sdr: document.getElementById('sdrStatus'),
@@ -81,6 +104,21 @@ const statusIndicators = {
 let detectionInterval = null;
 let isDetectionRunning = false;
 
+// requestAnimationFrame latch: bursts of status updates collapse into at
+// most one polar-plot redraw per display frame.
+let pendingResults = null;
+let drawRafId = null;
+let lastResultsKey = null;
+function scheduleDraw(results) {
+    pendingResults = results;
+    if (drawRafId === null) {
+        drawRafId = requestAnimationFrame(() => {
+            drawRafId = null;
+            drawPolarPlot(pendingResults);
+        });
+    }
+}
+
 // --- Utility Functions ---
 function updateStatus(carConnected, sdrReady, isRunning) {
     // Car Status
@@ -208,6 +246,7 @@ async function startDetection() {
     if (isDetectionRunning) return;
 
     // Clear previous results visually
+    lastResultsKey = null;
     drawPolarPlot({});
     statusIndicators.maxSignal.textContent = "Max Signal: N/A";
 
@@ -231,6 +270,7 @@ async function stopDetection() {
         const data = await response.json();
         
         // Clear the plot and table
+        lastResultsKey = null;
         drawPolarPlot({});
         statusIndicators.maxSignal.textContent = "Max Signal: N/A";
         statusIndicators.detectionStatus.textContent = data.message;
@@ -248,19 +288,9 @@ function drawPolarPlot(results) {
     const radius = size * 0.45;
     
     ctx.clearRect(0, 0, size, size);
-    
-    // 1. Draw Grid (Aesthetic)
-    ctx.strokeStyle = '#ccc';
-    ctx.lineWidth = 1;
-    ctx.beginPath();
-    ctx.arc(center, center, radius / 3, 0, 2 * Math.PI);
-    ctx.arc(center, center, radius * 2 / 3, 0, 2 * Math.PI);
-    ctx.arc(center, center, radius, 0, 2 * Math.PI);
-    ctx.moveTo(center, center); ctx.lineTo(center, center - radius); // 90
-    ctx.moveTo(center, center); ctx.lineTo(center, center + radius); // 270
-    ctx.moveTo(center, center); ctx.lineTo(center + radius, center); // 0
-    ctx.moveTo(center, center); ctx.lineTo(center - radius, center); // 180
-    ctx.stroke();
+
+    // 1. Draw Grid (pre-rendered offscreen)
+    ctx.drawImage(gridCanvas, 0, 0);
     
     // 2. Data Plotting
     const dataPoints = Object.entries(results);
@@ -393,8 +423,12 @@ async function pollStatus() {
             statusIndicators.currentDb.className = 'text-2xl font-bold text-gray-500 ml-2';
         }
         
-        // Update plot with current results
-        drawPolarPlot(data.results);
+        // Update plot only when the results actually changed
+        const resultsKey = JSON.stringify(data.results);
+        if (resultsKey !== lastResultsKey) {
+            lastResultsKey = resultsKey;
+            scheduleDraw(data.results);
+        }
         
         // Update rotation duration display
         if (data.rotation_duration !== undefined && statusIndicators.rotationDurationDisplay) {